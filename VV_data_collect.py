@@ -1,4 +1,4 @@
-import pysftp, os, sys
+import os, re, sys
 # from secret import pwd, hostname, export_id
 from datetime import date, timedelta
 from calendar import day_name
@@ -12,7 +12,21 @@ def parse_date(s):
 
     return date(year, month, day)
 
+# Matches every non-digit character, used to strip a file or
+# directory name down to its embedded YYYYMMDD date
+NON_DIGIT = re.compile(r'\D')
+
+# Parse the date embedded in a data file or directory name,
+# e.g. 'ItemSelectionDetails_20240326.csv' or 'Week_ending_20240331'
+def parse_name_date(name):
+    return parse_date(NON_DIGIT.sub('', name))
+
 def collect_data(args):
+    # pysftp (and the paramiko stack behind it) is only needed for
+    # downloading, so import it here rather than at module level to
+    # keep it out of the dashboard pages that import this module
+    import pysftp
+
     with pysftp.Connection(st.secrets['hostname'], 
                         username=st.secrets['username'],
                         private_key=st.secrets['private_key'],
@@ -37,8 +51,14 @@ def collect_data(args):
                 os.chdir(folder_name)
             else:
                 date_str = date.strftime(single_date, '%Y%m%d')
-                sftp.get(f'{date_str}/ItemSelectionDetails.csv', 
-                        localpath=f'./ItemSelectionDetails_{date_str}.csv')
+                local_file = f'./ItemSelectionDetails_{date_str}.csv'
+
+                # Download to a temporary file first and rename it into
+                # place once complete, so an interrupted transfer never
+                # leaves a partial CSV for the dashboard pages to read
+                sftp.get(f'{date_str}/ItemSelectionDetails.csv',
+                        localpath=f'{local_file}.part')
+                os.replace(f'{local_file}.part', local_file)
 
             # After Sunday's data is collected, move back 
             # to the parent directory to begin collection for the next week
@@ -51,21 +71,18 @@ def collect_data(args):
 def get_five_weeks_dirs(data_dir):
     # Get today's date
     today = date.today()
+    five_weeks = timedelta(weeks=5)
 
     # Get a list of relevant directory names
-    dir_lst = [name for name in os.listdir(data_dir)]
+    with os.scandir(data_dir) as entries:
+        dir_lst = [entry.name for entry in entries if entry.is_dir()]
     
     # Initialize a list to store directory names for return
     returned_dirs = []
 
     for dir_name in dir_lst:
-        # Collect date from the current directory name
-        date_str = ''.join(filter(str.isdigit, dir_name))
-
         # Date object for directory name currently being processed
-        current_dir_date = parse_date(date_str)
-
-        five_weeks = timedelta(weeks=5)
+        current_dir_date = parse_name_date(dir_name)
 
         if today - current_dir_date <= five_weeks:
             returned_dirs.append(dir_name)
@@ -1,7 +1,7 @@
 import streamlit as st
 import plotly.express as px
 from pandas import read_csv
-from VV_data_collect import get_five_weeks_dirs, parse_date
+from VV_data_collect import get_five_weeks_dirs, parse_name_date
 import os
 from calendar import day_name
 
@@ -14,15 +14,16 @@ five_weeks_dirs = get_five_weeks_dirs(data_dir)
 weekday_selected = st.selectbox('Select day of the week:', 
                                 options=('Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'))
 
+# Get list index for the currently selected weekday
+weekday_index = list(day_name).index(weekday_selected)
+
 files_lst = []
 for dir in five_weeks_dirs:
-    # Get a sorted list of file names in this directory
-    sorted_files = sorted(os.listdir(f'{data_dir}{dir}'))
-    print(sorted_files)
-
-    # Get list index for the currently selected weekday
-    weekday_index = list(day_name).index(weekday_selected)
-    # print(weekday_index)
+    # Get a sorted list of data file names in this directory
+    with os.scandir(f'{data_dir}{dir}') as entries:
+        sorted_files = sorted(entry.name for entry in entries
+                              if entry.is_file() and entry.name.endswith('.csv'))
+    # print(sorted_files)
 
     # Append the absolute path of the data file for the 
     # corresponding weekday to the files list
@@ -30,19 +31,26 @@ for dir in five_weeks_dirs:
 
 # print(files_lst)
 
+# The file's modification time is part of the cache key, so a CSV
+# re-downloaded over the same path is read again instead of served stale
+@st.cache_data
+def load_data(filepath, mtime_ns):
+    data = read_csv(filepath, usecols=['Net Price', 'Void?'])
+    return data
+
 # Initialize a dictionary to store a date and the
 # corresponding sales total for that date
 sales_totals = {}
 for filepath in files_lst:
     # Collect date from the current filename
-    date_str = ''.join(filter(str.isdigit, filepath[-12:-3]))
+    file_date = parse_name_date(os.path.basename(filepath))
 
-    df = read_csv(filepath, usecols=['Net Price', 'Void?'])
+    df = load_data(filepath, os.stat(filepath).st_mtime_ns)
     df = df[df['Void?'] != 'TRUE']
 
-    total_sales = round(sum(df['Net Price']), 2)
+    total_sales = round(df['Net Price'].sum(), 2)
 
-    sales_totals[parse_date(date_str)] = total_sales
+    sales_totals[file_date] = total_sales
 
 # print(sales_totals)
 # print(sales_totals.keys())